@@ -3,7 +3,16 @@ SIMPLE CLASSROOM SCHEDULER - Computer Science Department
 For 100-400 Level Courses
 """
 
+import bisect
+import heapq
 import json
+import sys
+from collections import deque
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json
+    orjson = None
 
 # ============================================================================
 # HARDCODED DATA - Time Slots and Classrooms
@@ -36,6 +45,16 @@ TIME_SLOTS = [
     ("Friday", "2 PM - 4 PM"),
 ]
 
+# The scheduler works on slot indices 0..N_SLOTS-1; these give the
+# day and time of each slot for display
+N_SLOTS = len(TIME_SLOTS)
+SLOT_DAY = tuple(day for day, _ in TIME_SLOTS)
+SLOT_TIME = tuple(time for _, time in TIME_SLOTS)
+
+# Chronological position of each day and time, for sorting the printout
+DAY_IDX = {day: i for i, day in enumerate(dict.fromkeys(SLOT_DAY))}
+TIME_IDX = {time: i for i, time in enumerate(dict.fromkeys(SLOT_TIME))}
+
 # Classrooms available in CS Department
 CLASSROOMS = [
     {"name": "Software Lab", "capacity": 120},
@@ -50,6 +69,14 @@ CLASSROOMS = [
     {"name": "Predegree Hall", "capacity": 100}
 ]
 
+# Classrooms as (name, capacity), smallest first, so the room search picks
+# the tightest room that fits without re-sorting on every slot
+_CLASSROOMS_SORTED = tuple(
+    (room['name'], room['capacity'])
+    for room in sorted(CLASSROOMS, key=lambda r: r['capacity'])
+)
+_CAPS = [capacity for _, capacity in _CLASSROOMS_SORTED]
+
 # CS Department Levels
 LEVELS = [100, 200, 300, 400]
 
@@ -61,6 +88,9 @@ LEVELS = [100, 200, 300, 400]
 def load_user_data():
     """Load courses and lecturers from user input file"""
     try:
+        if orjson is not None:
+            with open('user_input.json', 'rb') as f:
+                return orjson.loads(f.read())
         with open('user_input.json', 'r') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -72,9 +102,162 @@ def calculate_sessions_needed(hours_per_week):
     return (hours_per_week + 1) // 2  # Round up
 
 
-def schedule_courses():
+def _hopcroft_karp(adj, n_right):
+    """
+    Maximum bipartite matching (Hopcroft-Karp).
+    adj[u] lists the right-side nodes left node u may be matched to.
+    Returns the matched right node for each left node, or -1.
+    """
+    n_left = len(adj)
+    match_left = [-1] * n_left
+    match_right = [-1] * n_right
+    dist = [0] * n_left
+    unreached = n_left + 1
+    
+    def bfs():
+        # Layer the free left nodes and everything reachable by alternating paths
+        queue = deque()
+        for u in range(n_left):
+            if match_left[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+            else:
+                dist[u] = unreached
+        found = False
+        while queue:
+            u = queue.popleft()
+            for v in adj[u]:
+                w = match_right[v]
+                if w == -1:
+                    found = True
+                elif dist[w] == unreached:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        return found
+    
+    def dfs(u):
+        # Augment along the BFS layers
+        for v in adj[u]:
+            w = match_right[v]
+            if w == -1 or (dist[w] == dist[u] + 1 and dfs(w)):
+                match_left[u] = v
+                match_right[v] = u
+                return True
+        dist[u] = unreached
+        return False
+    
+    while bfs():
+        for u in range(n_left):
+            if match_left[u] == -1:
+                dfs(u)
+    
+    return match_left
+
+
+def _solve_cp_sat(course_lec, course_level, hours_available, sessions_needed, first_room,
+                  time_limit=10.0):
+    """
+    Whole-week scheduling with OR-Tools CP-SAT.
+    One boolean per (course, slot). Lecturers and levels take at most one
+    class per slot, lecturers stay within their weekly hours, and each
+    slot never holds more big classes than there are rooms to fit them.
+    Getting every course at least one session comes first, then finishing
+    courses, then the total number of sessions. Rooms are handed out per
+    slot afterwards.
+    Returns the best (course_idx, slot_idx, room_idx) tuples found within
+    the time limit, in slot order, or None if OR-Tools is not installed
+    or the solver finds nothing.
+    """
+    try:
+        from ortools.sat.python import cp_model
+    except ImportError:  # OR-Tools is optional; caller falls back to the matcher
+        return None
+    
+    model = cp_model.CpModel()
+    n_rooms = len(_CLASSROOMS_SORTED)
+    
+    x = {}
+    by_lecturer = {}
+    by_level = {}
+    for i, lec_id in enumerate(course_lec):
+        if lec_id < 0 or first_room[i] >= n_rooms or sessions_needed[i] <= 0:
+            continue
+        for slot_idx in range(N_SLOTS):
+            var = model.NewBoolVar(f"x_{i}_{slot_idx}")
+            x[i, slot_idx] = var
+            by_lecturer.setdefault(lec_id, {}).setdefault(slot_idx, []).append(var)
+            by_level.setdefault((course_level[i], slot_idx), []).append(var)
+    
+    if not x:
+        return None
+    
+    # No lecturer or level is in two places at once
+    for slots in by_lecturer.values():
+        for vars_ in slots.values():
+            model.AddAtMostOne(vars_)
+    for vars_ in by_level.values():
+        model.AddAtMostOne(vars_)
+    
+    # Room capacity: rooms are sorted, so a course fits rooms first_room..end.
+    # A slot can host every chosen course iff, for each k, at most
+    # n_rooms - k of them need a room at index k or above
+    for slot_idx in range(N_SLOTS):
+        for k in {first_room[i] for i, s in x if s == slot_idx}:
+            model.Add(sum(var for (i, s), var in x.items()
+                          if s == slot_idx and first_room[i] >= k) <= n_rooms - k)
+    
+    # Courses get at most the sessions they need
+    covered = []
+    finished = []
+    for i in {i for i, _ in x}:
+        vars_ = [x[i, slot_idx] for slot_idx in range(N_SLOTS)]
+        model.Add(sum(vars_) <= sessions_needed[i])
+        has_session = model.NewBoolVar(f"covered_{i}")
+        model.Add(sum(vars_) >= has_session)
+        covered.append(has_session)
+        is_full = model.NewBoolVar(f"finished_{i}")
+        model.Add(sum(vars_) >= sessions_needed[i] * is_full)
+        finished.append(is_full)
+    
+    # Lecturers teach at most their weekly hours (rounded up to sessions)
+    for lec_id, slots in by_lecturer.items():
+        max_sessions = calculate_sessions_needed(hours_available[lec_id])
+        model.Add(sum(var for vars_ in slots.values() for var in vars_) <= max_sessions)
+    
+    # Coverage outweighs finished courses, which outweigh extra sessions
+    session_weight = sum(sessions_needed) + 1
+    finished_weight = session_weight
+    covered_weight = (len(finished) + 1) * session_weight
+    model.Maximize(covered_weight * sum(covered)
+                   + finished_weight * sum(finished)
+                   + sum(x.values()))
+    
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = time_limit
+    status = solver.Solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return None
+    
+    # Give each slot's classes rooms; the capacity constraint guarantees a full match
+    assignments = []
+    for slot_idx in range(N_SLOTS):
+        chosen = [i for (i, s), var in x.items() if s == slot_idx and solver.Value(var)]
+        adj = [list(range(first_room[i], n_rooms)) for i in chosen]
+        for i, room_idx in zip(chosen, _hopcroft_karp(adj, n_rooms)):
+            assignments.append((i, slot_idx, room_idx))
+    
+    return assignments
+
+
+def schedule_courses(use_cp_sat=False):
     """
-    Main scheduling function - Simple Greedy First-Fit Algorithm
+    Main scheduling function - Slot-by-Slot Matching, with optional CP-SAT
+
+    With use_cp_sat=True and OR-Tools installed, solves the whole week with
+    CP-SAT (slow: runs up to its time limit). Otherwise walks the time
+    slots in order; for each slot, picks conflict-free courses by priority
+    (most sessions still needed first, then largest enrollment) and
+    matches them to free rooms with Hopcroft-Karp.
     """
     # Load user input
     data = load_user_data()
@@ -88,189 +271,314 @@ def schedule_courses():
             "message": "No courses to schedule. Please add courses first."
         }
     
-    # Build lecturer lookup
-    lecturers = {}
-    for lec in lecturers_data:
-        lecturers[lec['name']] = {
-            'hours_available': lec['hours_per_week'],
-            'hours_used': 0
-        }
+    # Build lecturer lookup: integer ids index the per-lecturer lists
+    lecturer_hours = {lec['name']: lec['hours_per_week'] for lec in lecturers_data}
+    lec_name_to_id = {name: lec_id for lec_id, name in enumerate(lecturer_hours)}
+    hours_available = list(lecturer_hours.values())
+    hours_used = [0] * len(hours_available)
+    
+    # Per-course columns, indexed like `courses`, so the hot loop reads
+    # list slots instead of course dicts
+    level_to_idx = {}
+    course_lec = [lec_name_to_id.get(c['lecturer'], -1) for c in courses]  # -1 if unknown
+    course_level = [level_to_idx.setdefault(c['level'], len(level_to_idx)) for c in courses]
+    course_enrollment = [c['enrollment'] for c in courses]
+    sessions_needed = [calculate_sessions_needed(c['hours_per_week']) for c in courses]
+    sessions_assigned = [0] * len(courses)
+    # First room big enough for at least 80% of the students
+    first_room = [bisect.bisect_left(_CAPS, enrollment * 0.8) for enrollment in course_enrollment]
     
-    # Track what's been used
-    room_usage = {}  # {(room_name, day, time): True}
-    lecturer_usage = {}  # {(lecturer_name, day, time): True}
-    level_usage = {}  # {(level, day, time): True}
+    # Track what's been used as bitmasks
+    room_busy = [0] * N_SLOTS  # per slot: bit i set = room i taken
+    lecturer_busy = [0] * len(hours_available)  # per lecturer id: bit = slot
+    level_busy = [0] * len(level_to_idx)  # per level index: bit = slot
     
-    schedule = []
+    assignments = []  # (course_idx, room_idx, slot_idx) per session
     unscheduled = []
+    fully_count = 0
+    partial_count = 0
+    unscheduled_count = 0
+    total_sessions = 0
     
-    # Process each course
-    for course in courses:
-        assigned = False
-        sessions_needed = calculate_sessions_needed(course['hours_per_week'])
-        sessions_assigned = 0
+    n_rooms = len(_CLASSROOMS_SORTED)
+    all_rooms = (1 << n_rooms) - 1
+    # Bit r set = room r can fit the course (every room from first_room up)
+    fit_mask = [all_rooms & ~((1 << room_idx) - 1) for room_idx in first_room]
+    
+    def assign(i, slot_idx, room_idx):
+        lec_id = course_lec[i]
         
-        lecturer_name = course['lecturer']
-        level = course['level']
+        # Assign the class!
+        assignments.append((i, room_idx, slot_idx))
         
-        # Check if lecturer exists
-        if lecturer_name not in lecturers:
-            unscheduled.append({
-                **course,
-                "reason": f"Lecturer {lecturer_name} not found in system"
-            })
-            continue
+        # Mark as used
+        room_busy[slot_idx] |= 1 << room_idx
+        lecturer_busy[lec_id] |= 1 << slot_idx
+        level_busy[course_level[i]] |= 1 << slot_idx
+        hours_used[lec_id] += 2
         
-        # Try to assign all needed sessions
-        for day, time in TIME_SLOTS:
-            if sessions_assigned >= sessions_needed:
-                break
-            
-            # Check if lecturer has hours available
-            if lecturers[lecturer_name]['hours_used'] >= lecturers[lecturer_name]['hours_available']:
-                continue
-            
-            # Check if lecturer is already teaching at this time
-            if (lecturer_name, day, time) in lecturer_usage:
-                continue
-            
-            # Check if students at this level have class at this time
-            if (level, day, time) in level_usage:
-                continue
+        sessions_assigned[i] += 1
+    
+    solved = None
+    if use_cp_sat:
+        solved = _solve_cp_sat(course_lec, course_level, hours_available,
+                               sessions_needed, first_room)
+    
+    if solved is not None:
+        for i, slot_idx, room_idx in solved:
+            assign(i, slot_idx, room_idx)
+        queue = []
+    else:
+        # Queue every course with a known lecturer, sessions to schedule and
+        # at least one room big enough, highest priority first
+        queue = [
+            (-sessions_needed[i], -course_enrollment[i], i)
+            for i in range(len(courses))
+            if course_lec[i] >= 0 and sessions_needed[i] > 0 and fit_mask[i]
+        ]
+        heapq.heapify(queue)
+    
+    for slot_idx in range(N_SLOTS):
+        if not queue:
+            break
+        slot_bit = 1 << slot_idx
+        
+        # Courses popped this slot, in priority order; they go back on the
+        # queue at the end of the slot so none can be placed twice in it
+        pending = []
+        requeue = []
+        
+        # Match conflict-free courses to free rooms until nothing more fits
+        while True:
+            busy_rooms = room_busy[slot_idx]
+            free_rooms = n_rooms - bin(busy_rooms).count("1")
+            open_levels = sum(1 for mask in level_busy if not mask & slot_bit)
             
-            # Find a suitable classroom
-            room_found = False
-            for room in sorted(CLASSROOMS, key=lambda r: r['capacity']):
-                # Check if room can fit students (at least 80% capacity)
-                if room['capacity'] < course['enrollment'] * 0.8:
-                    continue
+            candidates = []
+            adj = []
+            round_lecturers = set()
+            round_levels = set()
+            seen = 0
+            # Stop pulling once the slot's rooms or levels are all spoken for
+            while len(candidates) < free_rooms and len(round_levels) < open_levels:
+                if seen < len(pending):
+                    i = pending[seen]
+                elif queue:
+                    _, _, i = heapq.heappop(queue)
+                    lec_id = course_lec[i]
+                    
+                    # Lecturer out of hours: no later slot can help this course
+                    if hours_used[lec_id] >= hours_available[lec_id]:
+                        continue
+                    pending.append(i)
+                else:
+                    break
+                seen += 1
                 
-                # Check if room is available
-                if (room['name'], day, time) in room_usage:
+                lec_id = course_lec[i]
+                level = course_level[i]
+                
+                # Check if lecturer is already teaching at this time
+                if lecturer_busy[lec_id] & slot_bit or lec_id in round_lecturers:
                     continue
                 
-                # Assign the class!
-                schedule.append({
-                    "course": course['course_code'],
-                    "title": course['title'],
-                    "level": level,
-                    "lecturer": lecturer_name,
-                    "room": room['name'],
-                    "day": day,
-                    "time": time,
-                    "capacity": room['capacity'],
-                    "enrollment": course['enrollment']
-                })
+                # Check if students at this level have class at this time
+                if level_busy[level] & slot_bit or level in round_levels:
+                    continue
                 
-                # Mark as used
-                room_usage[(room['name'], day, time)] = True
-                lecturer_usage[(lecturer_name, day, time)] = True
-                level_usage[(level, day, time)] = True
-                lecturers[lecturer_name]['hours_used'] += 2
+                # Rooms that are free and can fit the students
+                free = fit_mask[i] & ~busy_rooms
+                if not free:
+                    continue
+                rooms = []
+                while free:
+                    low = free & -free
+                    rooms.append(low.bit_length() - 1)
+                    free ^= low
                 
-                sessions_assigned += 1
-                room_found = True
+                candidates.append(i)
+                adj.append(rooms)
+                round_lecturers.add(lec_id)
+                round_levels.add(level)
+            
+            if not candidates:
                 break
             
-            if not room_found:
-                # No room available at this slot
-                continue
+            matched = set()
+            for i, room_idx in zip(candidates, _hopcroft_karp(adj, n_rooms)):
+                if room_idx == -1:
+                    continue
+                
+                assign(i, slot_idx, room_idx)
+                matched.add(i)
+                
+                # Done for this slot; requeue if it still needs sessions
+                # and its lecturer still has hours to give
+                lec_id = course_lec[i]
+                if (sessions_assigned[i] < sessions_needed[i]
+                        and hours_used[lec_id] < hours_available[lec_id]):
+                    requeue.append(i)
+            
+            if not matched:
+                break
+            pending = [i for i in pending if i not in matched]
+        
+        # Requeue what was popped this slot with its updated priority
+        for i in pending + requeue:
+            heapq.heappush(queue, (sessions_assigned[i] - sessions_needed[i], -course_enrollment[i], i))
+    
+    for i, course in enumerate(courses):
+        total_sessions += sessions_assigned[i]
         
-        if sessions_assigned < sessions_needed:
+        # Check if lecturer exists
+        if course_lec[i] < 0:
             unscheduled.append({
-                **course,
-                "sessions_assigned": sessions_assigned,
-                "sessions_needed": sessions_needed,
-                "reason": f"Could only schedule {sessions_assigned}/{sessions_needed} sessions"
+                "course_code": course['course_code'],
+                "title": course['title'],
+                "level": course['level'],
+                "reason": f"Lecturer {course['lecturer']} not found in system",
+                "sessions_assigned": 0,
+                "sessions_needed": sessions_needed[i]
             })
+            unscheduled_count += 1
+            continue
+        
+        # Nothing to schedule: not counted as scheduled or unscheduled
+        if sessions_needed[i] == 0:
+            continue
         
-        if sessions_assigned > 0:
-            assigned = True
+        if sessions_assigned[i] >= sessions_needed[i]:
+            fully_count += 1
+        else:
+            unscheduled.append({
+                "course_code": course['course_code'],
+                "title": course['title'],
+                "level": course['level'],
+                "reason": f"Could only schedule {sessions_assigned[i]}/{sessions_needed[i]} sessions",
+                "sessions_assigned": sessions_assigned[i],
+                "sessions_needed": sessions_needed[i]
+            })
+            if sessions_assigned[i] > 0:
+                partial_count += 1
+            else:
+                unscheduled_count += 1
+    
+    # Build the schedule entries only now that every session is placed
+    schedule = [
+        {
+            "course": courses[ci]['course_code'],
+            "title": courses[ci]['title'],
+            "level": courses[ci]['level'],
+            "lecturer": courses[ci]['lecturer'],
+            "room": _CLASSROOMS_SORTED[ri][0],
+            "day": SLOT_DAY[si],
+            "time": SLOT_TIME[si],
+            "capacity": _CLASSROOMS_SORTED[ri][1],
+            "enrollment": courses[ci]['enrollment']
+        }
+        for ci, ri, si in assignments
+    ]
     
     # Calculate statistics
     total_courses = len(courses)
-    scheduled_courses = len([c for c in courses if c['course_code'] in [s['course'] for s in schedule]])
+    scheduled_courses = fully_count + partial_count
     
     stats = {
         "total_courses": total_courses,
-        "fully_scheduled": scheduled_courses - len(unscheduled),
-        "partially_scheduled": len([u for u in unscheduled if u.get('sessions_assigned', 0) > 0]),
-        "unscheduled": len([u for u in unscheduled if u.get('sessions_assigned', 0) == 0]),
+        "fully_scheduled": fully_count,
+        "partially_scheduled": partial_count,
+        "unscheduled": unscheduled_count,
         "success_rate": round((scheduled_courses / total_courses * 100) if total_courses > 0 else 0, 1),
-        "total_sessions": len(schedule)
+        "total_sessions": total_sessions
     }
     
     return {
         "schedule": schedule,
         "unscheduled": unscheduled,
         "statistics": stats,
-        "lecturer_workload": {name: data['hours_used'] for name, data in lecturers.items()}
+        "lecturer_workload": {name: hours_used[lec_id] for name, lec_id in lec_name_to_id.items()}
     }
 
 
-def print_schedule():
+def print_schedule(result=None):
     """Print the schedule in a nice format"""
-    result = schedule_courses()
+    if result is None:
+        result = schedule_courses()
+    out = []
     
-    print("\n" + "="*100)
-    print("COMPUTER SCIENCE DEPARTMENT - CLASSROOM SCHEDULE")
-    print("Levels: 100, 200, 300, 400")
-    print("="*100 + "\n")
+    out.append("\n" + "="*100)
+    out.append("COMPUTER SCIENCE DEPARTMENT - CLASSROOM SCHEDULE")
+    out.append("Levels: 100, 200, 300, 400")
+    out.append("="*100 + "\n")
     
     if not result['schedule']:
-        print(result.get('message', 'No schedule generated.'))
+        out.append(result.get('message', 'No schedule generated.'))
+        sys.stdout.write("\n".join(out) + "\n")
         return
     
-    # Group by level
-    for level in LEVELS:
-        level_schedule = [s for s in result['schedule'] if s['level'] == level]
-        if level_schedule:
-            print(f"\n{level} LEVEL COURSES")
-            print("-"*100)
-            print(f"{'Course':<12} {'Title':<30} {'Day':<10} {'Time':<15} {'Room':<20} {'Lecturer':<20}")
-            print("-"*100)
-            for entry in sorted(level_schedule, key=lambda x: (x['day'], x['time'])):
-                print(f"{entry['course']:<12} {entry['title'][:28]:<30} {entry['day']:<10} "
-                      f"{entry['time']:<15} {entry['room']:<20} {entry['lecturer']:<20}")
+    # Group by level, one sort for the whole schedule
+    rows = sorted(
+        (s for s in result['schedule'] if s['level'] in LEVELS),
+        key=lambda x: (x['level'], DAY_IDX[x['day']], TIME_IDX[x['time']])
+    )
+    level = None
+    for entry in rows:
+        if entry['level'] != level:
+            level = entry['level']
+            out.append(f"\n{level} LEVEL COURSES")
+            out.append("-"*100)
+            out.append(f"{'Course':<12} {'Title':<30} {'Day':<10} {'Time':<15} {'Room':<20} {'Lecturer':<20}")
+            out.append("-"*100)
+        out.append(f"{entry['course']:<12} {entry['title'][:28]:<30} {entry['day']:<10} "
+                   f"{entry['time']:<15} {entry['room']:<20} {entry['lecturer']:<20}")
     
     # Show unscheduled
     if result['unscheduled']:
-        print("\n" + "="*100)
-        print("UNSCHEDULED / PARTIALLY SCHEDULED COURSES")
-        print("-"*100)
+        out.append("\n" + "="*100)
+        out.append("UNSCHEDULED / PARTIALLY SCHEDULED COURSES")
+        out.append("-"*100)
         for item in result['unscheduled']:
-            print(f"• {item['course_code']}: {item['title']} - {item['reason']}")
+            out.append(f"• {item['course_code']}: {item['title']} - {item['reason']}")
     
     # Show statistics
-    print("\n" + "="*100)
-    print("STATISTICS")
-    print("-"*100)
+    out.append("\n" + "="*100)
+    out.append("STATISTICS")
+    out.append("-"*100)
     stats = result['statistics']
-    print(f"Total Courses: {stats['total_courses']}")
-    print(f"Fully Scheduled: {stats['fully_scheduled']}")
-    print(f"Partially Scheduled: {stats['partially_scheduled']}")
-    print(f"Unscheduled: {stats['unscheduled']}")
-    print(f"Success Rate: {stats['success_rate']}%")
-    print(f"Total Sessions: {stats['total_sessions']}")
+    out.append(f"Total Courses: {stats['total_courses']}")
+    out.append(f"Fully Scheduled: {stats['fully_scheduled']}")
+    out.append(f"Partially Scheduled: {stats['partially_scheduled']}")
+    out.append(f"Unscheduled: {stats['unscheduled']}")
+    out.append(f"Success Rate: {stats['success_rate']}%")
+    out.append(f"Total Sessions: {stats['total_sessions']}")
     
     # Lecturer workload
-    print("\n" + "="*100)
-    print("LECTURER WORKLOAD")
-    print("-"*100)
+    out.append("\n" + "="*100)
+    out.append("LECTURER WORKLOAD")
+    out.append("-"*100)
     for lecturer, hours in result['lecturer_workload'].items():
-        print(f"{lecturer}: {hours} hours")
+        out.append(f"{lecturer}: {hours} hours")
+    
+    out.append("\n" + "="*100)
     
-    print("\n" + "="*100)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def save_schedule_to_file():
+def save_schedule_to_file(result=None):
     """Save schedule to JSON file"""
-    result = schedule_courses()
-    with open('schedule_output.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    if result is None:
+        result = schedule_courses()
+    if orjson is not None:
+        with open('schedule_output.json', 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open('schedule_output.json', 'w') as f:
+            json.dump(result, f, indent=2)
     print("Schedule saved to: schedule_output.json")
 
 
 if __name__ == "__main__":
-    print_schedule()
-    save_schedule_to_file()
+    # Pass --cp-sat to try the OR-Tools solver instead of the matcher
+    result = schedule_courses(use_cp_sat="--cp-sat" in sys.argv[1:])
+    print_schedule(result)
+    save_schedule_to_file(result)